@@ -1,9 +1,10 @@
 import asyncio
-import uuid
+import secrets
+import time
 from datetime import datetime
 from typing import Optional, Union
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException, status
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 
 from app.models import (
@@ -12,10 +13,48 @@ from app.models import (
     ProcessJobCreate,
     Task,
     TaskCreate,
+    TaskStatus,
     TaskUpdate,
 )
+from app.serialize import TypeAdapter
 from app.storage import job_storage, task_storage
 
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
+# Caps concurrent batch items across requests, independent of the per-request item limit.
+_BATCH_SEMAPHORE = asyncio.Semaphore(64)
+
+_EVENT_PREFIX = b"data: Event "
+
+_ROOT_BODY = {"Hello": "World"}
+
+_HEALTH_BODY = {
+    "status": "healthy",
+    "service": "fastapi-example",
+    "version": "1.0.0"
+}
+
+_ERROR_MESSAGES: dict[int, str] = {
+    400: "Bad Request - Invalid input",
+    401: "Unauthorized - Authentication required",
+    403: "Forbidden - Access denied",
+    404: "Not Found - Resource does not exist",
+    500: "Internal Server Error - Something went wrong",
+    503: "Service Unavailable - Service is temporarily unavailable"
+}
+
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _cached_now_iso() -> str:
+    # /health is polled constantly; one-second timestamp resolution is enough there.
+    global _now_iso_cache
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_iso_cache[1]
+
+
 app = FastAPI(
     title="FastAPI Example API",
     description="Example API demonstrating CRUD operations, background tasks, and async patterns",
@@ -24,17 +63,17 @@ app = FastAPI(
 
 
 @app.get("/")
-def read_root():
-    return {"Hello": "World"}
+async def read_root():
+    return _ROOT_BODY
 
 
 @app.get("/items/{item_id}")
-def read_item(item_id: int, q: Union[str, None] = None):
+async def read_item(item_id: int, q: Union[str, None] = None):
     return {"item_id": item_id, "q": q}
 
 
 @app.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
-def create_task(task_data: TaskCreate):
+async def create_task(task_data: TaskCreate):
     task = task_storage.create(
         title=task_data.title,
         description=task_data.description,
@@ -44,17 +83,15 @@ def create_task(task_data: TaskCreate):
 
 
 @app.get("/tasks", response_model=list[Task])
-def list_tasks(status_filter: Optional[str] = None):
-    if status_filter and status_filter not in ["pending", "in_progress", "completed"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid status filter. Must be: pending, in_progress, or completed"
-        )
-    return task_storage.get_all(status=status_filter)
+async def list_tasks(status_filter: Optional[TaskStatus] = None):
+    tasks = task_storage.get_all(status=status_filter)
+    # Returning a Response skips FastAPI's per-request response_model handling;
+    # response_model is kept for the OpenAPI schema.
+    return Response(content=_TASK_LIST_ADAPTER.dump_json(tasks), media_type="application/json")
 
 
 @app.get("/tasks/{task_id}", response_model=Task)
-def get_task(task_id: int):
+async def get_task(task_id: int):
     task = task_storage.get(task_id)
     if not task:
         raise HTTPException(
@@ -65,7 +102,7 @@ def get_task(task_id: int):
 
 
 @app.put("/tasks/{task_id}", response_model=Task)
-def update_task(task_id: int, task_data: TaskUpdate):
+async def update_task(task_id: int, task_data: TaskUpdate):
     task = task_storage.update(
         task_id=task_id,
         title=task_data.title,
@@ -81,23 +118,23 @@ def update_task(task_id: int, task_data: TaskUpdate):
 
 
 @app.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(task_id: int):
+async def delete_task(task_id: int):
     deleted = task_storage.delete(task_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-def send_notification(task_id: int, task_title: str):
-    import time
-    time.sleep(2)
+async def send_notification(task_id: int, task_title: str):
+    await asyncio.sleep(2)
     print(f"NOTIFICATION SENT: Task '{task_title}' (ID: {task_id}) has been created")
 
 
 @app.post("/tasks/{task_id}/notify")
-def notify_task_creation(task_id: int, background_tasks: BackgroundTasks):
+async def notify_task_creation(task_id: int, background_tasks: BackgroundTasks):
     task = task_storage.get(task_id)
     if not task:
         raise HTTPException(
@@ -109,18 +146,17 @@ def notify_task_creation(task_id: int, background_tasks: BackgroundTasks):
     return {"message": f"Notification queued for task {task_id}"}
 
 
-def process_job_background(job_id: str, data: list[str], delay: float):
-    import time
+async def process_job_background(job_id: str, data: list[str], delay: float):
     job_storage.update_status(job_id, "processing")
-    time.sleep(delay)
+    await asyncio.sleep(delay)
     result = f"Processed {len(data)} items: {', '.join(data)}"
     job_storage.update_status(job_id, "completed", result)
     print(f"JOB COMPLETED: {job_id} - {result}")
 
 
 @app.post("/process", status_code=status.HTTP_202_ACCEPTED)
-def start_background_job(job_data: ProcessJobCreate, background_tasks: BackgroundTasks):
-    job_id = f"job-{uuid.uuid4().hex[:8]}"
+async def start_background_job(job_data: ProcessJobCreate, background_tasks: BackgroundTasks):
+    job_id = f"job-{secrets.token_hex(4)}"
     job = job_storage.create(job_id, job_data.data)
 
     background_tasks.add_task(process_job_background, job_id, job_data.data, job_data.delay)
@@ -133,7 +169,7 @@ def start_background_job(job_data: ProcessJobCreate, background_tasks: Backgroun
 
 
 @app.get("/jobs/{job_id}")
-def get_job_status(job_id: str):
+async def get_job_status(job_id: str):
     job = job_storage.get(job_id)
     if not job:
         raise HTTPException(
@@ -156,15 +192,17 @@ async def simulate_external_api():
 @app.post("/async/batch")
 async def process_batch(batch: BatchProcessRequest):
     async def process_item(item: str, delay: float) -> dict[str, str]:
-        await asyncio.sleep(delay)
+        async with _BATCH_SEMAPHORE:
+            await asyncio.sleep(delay)
         return {
             "item": item,
             "processed_at": datetime.now().isoformat(),
             "status": "completed"
         }
 
-    tasks = [process_item(item, batch.delay) for item in batch.items]
-    results = await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(process_item(item, batch.delay)) for item in batch.items]
+    results = [task.result() for task in tasks]
 
     return {
         "message": f"Processed {len(batch.items)} items concurrently",
@@ -175,7 +213,7 @@ async def process_batch(batch: BatchProcessRequest):
 async def event_generator():
     for i in range(5):
         await asyncio.sleep(1)
-        yield f"data: Event {i + 1} at {datetime.now().isoformat()}\n\n"
+        yield _EVENT_PREFIX + str(i + 1).encode() + b" at " + datetime.now().isoformat().encode() + b"\n\n"
 
 
 @app.get("/async/stream")
@@ -187,17 +225,12 @@ async def stream_events():
 
 
 @app.get("/health")
-def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "fastapi-example",
-        "version": "1.0.0"
-    }
+async def health_check():
+    return {**_HEALTH_BODY, "timestamp": _cached_now_iso()}
 
 
 @app.post("/echo")
-def echo_request(request: EchoRequest):
+async def echo_request(request: EchoRequest):
     return {
         "received": request.message,
         "metadata": request.metadata,
@@ -207,20 +240,13 @@ def echo_request(request: EchoRequest):
 
 
 @app.get("/error")
-def trigger_error(code: int = 500):
-    error_messages = {
-        400: "Bad Request - Invalid input",
-        401: "Unauthorized - Authentication required",
-        403: "Forbidden - Access denied",
-        404: "Not Found - Resource does not exist",
-        500: "Internal Server Error - Something went wrong",
-        503: "Service Unavailable - Service is temporarily unavailable"
-    }
-
-    if code not in error_messages:
+async def trigger_error(code: int = 500):
+    detail = _ERROR_MESSAGES.get(code)
+    if detail is None:
         code = 500
+        detail = _ERROR_MESSAGES[code]
 
     raise HTTPException(
         status_code=code,
-        detail=error_messages[code]
-    )
\ No newline at end of file
+        detail=detail
+    )
@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
+TaskStatus = Literal["pending", "in_progress", "completed"]
+
 
 class TaskCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
     description: Optional[str] = Field(None, max_length=1000, description="Task description")
-    status: str = Field(default="pending", pattern="^(pending|in_progress|completed)$")
+    status: TaskStatus = "pending"
 
     model_config = {
         "json_schema_extra": {
@@ -24,7 +26,7 @@ class TaskCreate(BaseModel):
 class TaskUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
-    status: Optional[str] = Field(None, pattern="^(pending|in_progress|completed)$")
+    status: Optional[TaskStatus] = None
 
     model_config = {
         "json_schema_extra": {
@@ -41,7 +43,7 @@ class Task(BaseModel):
     id: int
     title: str
     description: Optional[str]
-    status: str
+    status: TaskStatus
     created_at: datetime
     updated_at: datetime
 
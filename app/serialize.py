@@ -0,0 +1,10 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter as _TypeAdapter
+
+if TYPE_CHECKING:
+    TypeAdapter = _TypeAdapter
+else:
+    # Building a TypeAdapter compiles a validator and serializer, so reuse one per type.
+    TypeAdapter = lru_cache(maxsize=128)(_TypeAdapter)
@@ -1,37 +1,42 @@
+import itertools
 from datetime import datetime
-from typing import Optional
-from app.models import Task, ProcessJob
+from typing import Optional, get_args
+from app.models import Task, TaskStatus, ProcessJob
 
 
 class TaskStorage:
     def __init__(self):
         self.tasks: dict[int, Task] = {}
-        self.next_id: int = 1
+        self._ids = itertools.count(1)
+        self.by_status: dict[TaskStatus, set[int]] = {status: set() for status in get_args(TaskStatus)}
 
-    def create(self, title: str, description: Optional[str], status: str) -> Task:
+    def create(self, title: str, description: Optional[str], status: TaskStatus) -> Task:
+        task_id = next(self._ids)
         now = datetime.now()
-        task = Task(
-            id=self.next_id,
+        # Inputs were already validated by TaskCreate at the API boundary and
+        # the id/timestamps are generated here, so skip re-validation.
+        task = Task.model_construct(
+            id=task_id,
             title=title,
             description=description,
             status=status,
             created_at=now,
             updated_at=now
         )
-        self.tasks[self.next_id] = task
-        self.next_id += 1
+        self.tasks[task_id] = task
+        self.by_status[status].add(task_id)
         return task
 
     def get(self, task_id: int) -> Optional[Task]:
         return self.tasks.get(task_id)
 
-    def get_all(self, status: Optional[str] = None) -> list[Task]:
+    def get_all(self, status: Optional[TaskStatus] = None) -> list[Task]:
         if status:
-            return [task for task in self.tasks.values() if task.status == status]
+            return [self.tasks[task_id] for task_id in sorted(self.by_status[status])]
         return list(self.tasks.values())
 
     def update(self, task_id: int, title: Optional[str] = None,
-               description: Optional[str] = None, status: Optional[str] = None) -> Optional[Task]:
+               description: Optional[str] = None, status: Optional[TaskStatus] = None) -> Optional[Task]:
         task = self.tasks.get(task_id)
         if not task:
             return None
@@ -40,15 +45,18 @@ class TaskStorage:
             task.title = title
         if description is not None:
             task.description = description
-        if status is not None:
+        if status is not None and status != task.status:
+            self.by_status[task.status].discard(task_id)
+            self.by_status[status].add(task_id)
             task.status = status
 
         task.updated_at = datetime.now()
         return task
 
     def delete(self, task_id: int) -> bool:
-        if task_id in self.tasks:
-            del self.tasks[task_id]
+        task = self.tasks.pop(task_id, None)
+        if task:
+            self.by_status[task.status].discard(task_id)
             return True
         return False
 
@@ -58,7 +66,8 @@ class JobStorage:
         self.jobs: dict[str, ProcessJob] = {}
 
     def create(self, job_id: str, data: list[str]) -> ProcessJob:
-        job = ProcessJob(
+        # data was validated by ProcessJobCreate; everything else is generated here.
+        job = ProcessJob.model_construct(
             id=job_id,
             status="queued",
             data=data,